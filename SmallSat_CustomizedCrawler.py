@@ -2,83 +2,306 @@
 
 import os
 import re
+import calendar
+import functools
+import csv
+import json
+import hashlib
 import time
+import random
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
 from tqdm import tqdm
 
+# Upper bound on concurrent connections to digitalcommons.usu.edu
+MAX_CONNECTIONS_PER_HOST = 16
+
+# Root logger, matching the module-level logging calls configured by setup_logging
+_log = logging.getLogger()
+
+def _build_session():
+    """
+    Creates the HTTP session. With SMALLSAT_CACHE=1 set, GET responses are cached in a local
+    SQLite file via requests-cache for a day, so re-runs while developing skip the network.
+    """
+    if os.environ.get('SMALLSAT_CACHE') == '1':
+        try:
+            from requests_cache import CachedSession
+            return CachedSession('smallsat_cache', backend='sqlite', expire_after=86400,
+                                 allowable_methods=['GET'])
+        except ImportError:
+            # Use the logger directly; logging.warning() here would configure logging before setup_logging runs
+            _log.warning("SMALLSAT_CACHE=1 but requests-cache is not installed; caching disabled.")
+    return requests.Session()
+
+# Shared session so all requests to digitalcommons.usu.edu reuse keep-alive connections.
+# pool_block makes extra callers wait for a free connection instead of opening throwaway ones.
+SESSION = _build_session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+                                      pool_block=True, max_retries=0))
+SESSION.headers['User-Agent'] = 'SmallSatCrawler/1.0'
+
+# Large chunks keep the PDF download loop bound by the network rather than Python overhead
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# (connect, read) timeouts in seconds so a stalled socket can never hang a worker
+PAGE_TIMEOUT = (5, 30)
+PDF_TIMEOUT = (5, 60)
+
+# Sub-folder of the output directory holding the cached schedule page and its ETag/Last-Modified validators
+HTTP_CACHE_DIRNAME = '.http_cache'
+
+# Columns of the per-paper metadata record
+PAPER_FIELDS = ['Title', 'Date', 'Abstract', 'Link']
+
+# Precompiled patterns used while parsing pages
+_PDF_LINK_RE = re.compile(r'https://digitalcommons\.usu\.edu/cgi/viewcontent\.cgi\?article=\d+&context=smallsat')
+_DATE_RE = re.compile(r'(\w+)\s+(\d+)')
+
+# Characters not allowed in Windows file names
+_SAFE_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Lower-cased month names built once at import (C locale), so parsing does not depend on LC_TIME
+_MONTHS = {name.lower(): num for num, name in enumerate(calendar.month_name) if name}
+
+@functools.lru_cache(maxsize=None)
+def _paper_link_re(year):
+    """Returns the compiled paper-page link pattern for the given conference year."""
+    return re.compile(rf'/smallsat/{year}/all{year}/\d+')
+
+# Day and session rows of the conference schedule table
+_SCHEDULE_TABLE_XPATH = '(//table[contains(concat(" ", normalize-space(@class), " "), " vcalendar ")])[1]'
+_SCHEDULE_ROWS_XPATH = _SCHEDULE_TABLE_XPATH + '//tr[contains(@class, "day") or contains(@class, "vevent")]'
+
+# Only build the parts of each paper page the parsers actually look at
+_PAPER_STRAINER = SoupStrainer(['title', 'a', 'div', 'meta'])
+
+class CircuitOpen(Exception):
+    """Raised when a request is refused because the host's circuit breaker is open."""
+
+class PermanentDownloadError(Exception):
+    """Raised when a download fails with a non-retryable HTTP status that a later run would not fix."""
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker for a single host.
+    Opens after `threshold` consecutive failures and lets one probe request
+    through once `reset_timeout` seconds have passed.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    def __init__(self, threshold=5, reset_timeout=60):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before(self):
+        """Raises CircuitOpen if requests should not be attempted right now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Let a single probe request through
+                self.state = self.HALF_OPEN
+                return
+            raise CircuitOpen(f"Circuit open, refusing request for {self.reset_timeout}s after repeated failures")
+
+    def on_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+
+    def on_failure(self):
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or self.failure_count >= self.threshold:
+                if self.state != self.OPEN:
+                    logging.warning(f"Circuit breaker opened after {self.failure_count} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+# All requests go to digitalcommons.usu.edu, so a single breaker covers the host
+BREAKER = CircuitBreaker()
+
 def setup_logging(log_level=logging.INFO):
     logging.basicConfig(
         level=log_level,
         format='%(asctime)s - %(levelname)s - %(message)s'
     )
 
-def fetch_soup(url):
-    """Fetches and parses HTML content from a URL."""
+def _cache_paths(cache_dir, url):
+    """Returns the (body, validators) file paths used to cache a URL in cache_dir."""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{key}.html"), os.path.join(cache_dir, f"{key}.json")
+
+def _load_cached(cache_dir, url):
+    """Returns (body, validators) for a cached URL, or (None, {}) if it is not cached."""
+    body_path, meta_path = _cache_paths(cache_dir, url)
+    try:
+        with open(meta_path, encoding='utf-8') as f_meta:
+            validators = json.load(f_meta)
+        with open(body_path, 'rb') as f_body:
+            return f_body.read(), validators
+    except (OSError, ValueError):
+        return None, {}
+
+def _store_cached(cache_dir, url, body, validators):
+    """Caches a response body with its ETag/Last-Modified validators."""
+    body_path, meta_path = _cache_paths(cache_dir, url)
+    os.makedirs(cache_dir, exist_ok=True)
     try:
-        response = requests.get(url)
+        for path, data in ((body_path, body), (meta_path, json.dumps(validators).encode('utf-8'))):
+            with open(path + '.tmp', 'wb') as f_tmp:
+                f_tmp.write(data)
+            os.replace(path + '.tmp', path)
+    except OSError as e:
+        logging.warning(f"Failed to cache {url}: {e}")
+
+def fetch_bytes(url, cache_dir=None, session=SESSION, breaker=BREAKER):
+    """
+    Fetches a URL and returns the raw response body, or None on failure.
+    If cache_dir is given, the request is made conditional on the cached ETag/Last-Modified
+    and a 304 Not Modified response returns the cached body.
+    """
+    try:
+        breaker.before()
+    except CircuitOpen as e:
+        logging.error(f"Failed to fetch {url}: {e}")
+        return None
+    cached_body, validators = _load_cached(cache_dir, url) if cache_dir else (None, {})
+    headers = {}
+    if cached_body is not None:
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+    try:
+        response = session.get(url, headers=headers, timeout=PAGE_TIMEOUT)
+        if response.status_code >= 400 and not is_recoverable_status(response.status_code):
+            # The host answered, so this does not count against the breaker
+            breaker.on_success()
+            logging.error(f"Failed to fetch {url}: HTTP {response.status_code}")
+            return None
         response.raise_for_status()
-        return BeautifulSoup(response.text, features="lxml")
+    except requests.exceptions.Timeout as e:
+        breaker.on_failure()
+        logging.error(f"Timed out fetching {url}: {e}")
+        return None
     except Exception as e:
+        breaker.on_failure()
         logging.error(f"Failed to fetch {url}: {e}")
         return None
+    breaker.on_success()
+    if response.status_code == 304 and cached_body is not None:
+        logging.info(f"Not modified, using cached copy: {url}")
+        return cached_body
+    if cache_dir:
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        if validators['etag'] or validators['last_modified']:
+            _store_cached(cache_dir, url, response.content, validators)
+    return response.content
+
+def fetch_page(url, parse_only=None, session=SESSION, breaker=BREAKER):
+    """
+    Fetches a URL and parses its HTML, optionally restricted by a SoupStrainer.
+    Returns a (soup, raw_bytes) tuple, or (None, None) on failure.
+    """
+    raw_html = fetch_bytes(url, session=session, breaker=breaker)
+    if raw_html is None:
+        return None, None
+    return BeautifulSoup(raw_html, features="lxml", parse_only=parse_only), raw_html
 
+def write_debug_html(path, raw_bytes):
+    """Saves the original page bytes for debugging when DEBUG logging is enabled."""
+    if not _log.isEnabledFor(logging.DEBUG):
+        return
+    with open(path, "wb") as f_debug:
+        f_debug.write(raw_bytes)
 
-def extract_paper_links_with_dates(soup, year):
-    """Extracts all paper page links for the given year, mapping each to its date."""
-    schedule_table = soup.find('table', class_='vcalendar')
-    if not schedule_table:
+
+def extract_paper_links_with_dates(html, year):
+    """Extracts all paper page links for the given year from the raw schedule page HTML, mapping each to its date."""
+    try:
+        root = lxml.html.fromstring(html)
+    except Exception as e:
+        logging.error(f"Failed to parse schedule page: {e}")
+        return {}
+    rows = root.xpath(_SCHEDULE_ROWS_XPATH)
+    if not rows and not root.xpath(_SCHEDULE_TABLE_XPATH):
         logging.error('No table with class vcalendar found!')
         # Print all tables for debugging
-        for idx, t in enumerate(soup.find_all('table')):
-            logging.info(f'Table {idx} HTML: {str(t)[:100]}')
+        for idx, t in enumerate(root.iter('table')):
+            logging.info(f'Table {idx} HTML: {lxml.html.tostring(t, encoding="unicode")[:100]}')
         return {}
     paper_date_map = {}
     current_date = None
     # The logic below persists the last seen date (from a 'day' row)
     # and assigns it to all subsequent paper links (from 'vevent' rows)
     skipped_links = []
-    for idx, row in enumerate(schedule_table.find_all('tr')):
-        row_classes = row.get('class', [])
-        logging.info(f"Row {idx} classes: {row_classes}, HTML: {str(row)[:100]}")
+    paper_link_re = _paper_link_re(year)
+    debug_enabled = _log.isEnabledFor(logging.DEBUG)
+    for idx, row in enumerate(rows):
+        row_classes = row.get('class', '')
+        if debug_enabled:
+            _log.debug("Row %d classes: %s", idx, row_classes)
         # Use substring matching for robustness
-        if any('day' in c for c in row_classes):
-            date_text = row.get_text(strip=True)
-            import datetime
+        if 'day' in row_classes:
+            date_text = ''.join(text.strip() for text in row.itertext())
             try:
-                import re
                 date_parts = date_text.split(', ')
                 if len(date_parts) == 2:
                     # Use regex to extract month and day robustly
-                    match = re.search(r'(\w+)\s+(\d+)', date_parts[1])
+                    match = _DATE_RE.search(date_parts[1])
                     if match:
                         month = match.group(1)
                         day = int(match.group(2))
-                        month_num = datetime.datetime.strptime(month, '%B').month
+                        month_num = _MONTHS.get(month.lower())
+                        if month_num is None:
+                            _log.warning("Unknown month name in day row: %s", date_text)
+                            continue
                         current_date = f"{year}{month_num:02d}{day:02d}"
-                        logging.info(f"Set current_date: {current_date} for day row: {date_text}")
+                        if debug_enabled:
+                            _log.debug("Set current_date: %s for day row: %s", current_date, date_text)
                     else:
-                        logging.warning(f"Regex failed to parse month/day from: {date_parts[1]}")
+                        _log.warning("Regex failed to parse month/day from: %s", date_parts[1])
                 else:
-                    logging.warning(f"Could not parse date from day row: {date_text}")
+                    _log.warning("Could not parse date from day row: %s", date_text)
             except Exception as e:
-                logging.warning(f"Exception parsing date from day row: {date_text}, error: {e}")
-        elif any('vevent' in c for c in row_classes):
-            link_tag = row.find('a', href=re.compile(rf'/smallsat/{year}/all{year}/\d+'))
-            if link_tag:
-                paper_link = link_tag.get('href')
+                _log.warning("Exception parsing date from day row: %s, error: %s", date_text, e)
+        else:
+            paper_link = next((href for href in row.xpath('.//a/@href') if paper_link_re.search(href)), None)
+            if paper_link:
                 if current_date:
                     paper_date_map[paper_link] = current_date
-                    logging.info(f"Assigned date {current_date} to paper link {paper_link}")
+                    if debug_enabled:
+                        _log.debug("Assigned date %s to paper link %s", current_date, paper_link)
                 else:
                     skipped_links.append(paper_link)
-                    logging.info(f"Skipping paper link {paper_link} because no current_date has been set yet.")
+                    if debug_enabled:
+                        _log.debug("Skipping paper link %s because no current_date has been set yet.", paper_link)
     logging.info(f"Total papers mapped to dates: {len(paper_date_map)}")
     if skipped_links:
         logging.warning(f"Skipped {len(skipped_links)} paper links due to missing date: {skipped_links}")
     return paper_date_map
 
+def _safe_filename(title):
+    """Replaces characters that are invalid in file names and caps the length at 180 characters."""
+    return _SAFE_RE.sub('_', title)[:180].rstrip(' .') or "UnknownTitle"
+
 def get_article_title(soup):
     """Extracts the article title from the page's <title> tag."""
     if soup.title and soup.title.string:
@@ -88,33 +311,143 @@ def get_article_title(soup):
 
 def find_pdf_link(soup):
     """Finds the direct PDF download link in the soup."""
-    pdf_link = soup.find('a', href=re.compile(r'https://digitalcommons\.usu\.edu/cgi/viewcontent\.cgi\?article=\d+&context=smallsat'))
+    pdf_link = soup.find('a', href=_PDF_LINK_RE)
     if pdf_link:
         url = pdf_link.get('href')
         if isinstance(url, str) and url:
             return url
     return None
 
-def download_pdf(url, output_path, max_retries=5):
-    """Downloads a PDF file with retry logic."""
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            logging.info(f"Downloaded: {output_path}")
-            return True
-        except Exception as e:
-            logging.warning(f"Attempt {attempt} failed for {url}: {e}")
-            time.sleep(0.5)
-    logging.error(f"Failed to download after {max_retries} attempts: {url}")
-    return False
+def backoff_delay(attempt, base=1.0, cap=30.0, jitter=0.5):
+    """Returns an exponential backoff delay (seconds) with random jitter for the given attempt."""
+    return min(cap, base * (2 ** (attempt - 1))) * (1 + jitter * random.random())
+
+def is_recoverable_status(status_code):
+    """Returns True for HTTP status codes worth retrying (429 and 5xx)."""
+    return status_code == 429 or status_code >= 500
+
+def download_pdf(url, output_path, max_retries=5, session=SESSION, breaker=BREAKER):
+    """
+    Downloads a PDF file with exponential backoff retry logic.
+    A download that fails all its attempts counts as one failure against the circuit breaker.
+    The file is streamed to a per-thread '.part' file and only renamed into place once complete,
+    so an interrupted download never leaves a truncated PDF behind.
+    Returns True on success and False on a transient failure (retries exhausted or circuit open).
+    Raises PermanentDownloadError for a non-retryable 4xx response.
+    """
+    # Unique per thread so two papers that map to the same file name never share a temp file
+    part_path = f"{output_path}.{os.getpid()}-{threading.get_ident()}.part"
+    failed_attempts = 0
+    try:
+        for attempt in range(1, max_retries + 1):
+            try:
+                breaker.before()
+            except CircuitOpen as e:
+                if failed_attempts:
+                    # Report this download's failure so a half-open probe reopens the breaker
+                    breaker.on_failure()
+                logging.error(f"Giving up on {url}: {e}")
+                return False
+            try:
+                with session.get(url, stream=True, timeout=PDF_TIMEOUT) as response:
+                    if response.status_code >= 400 and not is_recoverable_status(response.status_code):
+                        # The host answered, so this does not count against the breaker
+                        breaker.on_success()
+                        raise PermanentDownloadError(f"HTTP {response.status_code} for {url}")
+                    response.raise_for_status()
+                    with open(part_path, 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                    # Content-Length is the encoded size, so only compare it for identity-encoded bodies
+                    expected_size = response.headers.get('Content-Length')
+                    if expected_size and not response.headers.get('Content-Encoding'):
+                        actual_size = os.path.getsize(part_path)
+                        if actual_size != int(expected_size):
+                            raise IOError(f"Incomplete download: got {actual_size} of {expected_size} bytes")
+                os.replace(part_path, output_path)
+                breaker.on_success()
+                logging.info(f"Downloaded: {output_path}")
+                return True
+            except PermanentDownloadError:
+                raise
+            except requests.exceptions.Timeout as e:
+                # Timeouts are recoverable, fall through to backoff and retry
+                failed_attempts += 1
+                logging.warning(f"Attempt {attempt} timed out for {url}: {e}")
+            except Exception as e:
+                failed_attempts += 1
+                logging.warning(f"Attempt {attempt} failed for {url}: {e}")
+            if attempt < max_retries:
+                time.sleep(backoff_delay(attempt))
+        breaker.on_failure()
+        logging.error(f"Failed to download after {max_retries} attempts: {url}")
+        return False
+    finally:
+        if os.path.exists(part_path):
+            os.unlink(part_path)
 
 
+def extract_abstract(soup):
+    """Extracts the abstract text from a paper page, falling back to the meta description."""
+    abstract = ""
+    abstract_tag = soup.find('div', id='abstract')
+    if abstract_tag:
+        abstract_p = abstract_tag.find('p')
+        if isinstance(abstract_p, Tag):
+            abstract = abstract_p.get_text(strip=True)
+        elif isinstance(abstract_tag, Tag):
+            abstract = abstract_tag.get_text(strip=True)
+    else:
+        # Fallback: try meta tag
+        meta_abstract = soup.find('meta', attrs={'name': 'description'})
+        if isinstance(meta_abstract, Tag):
+            content = meta_abstract.get('content', None)
+            if content:
+                abstract = content
+    return abstract
 
-def main(year=2025, test_flag=False, log_level=logging.INFO, download_flag=True):
+def process_paper(rel_link, paper_date, output_dir, download_flag=True):
+    """
+    Fetches a single paper page, extracts its metadata and optionally downloads its PDF.
+    Returns a dict with the paper info, or None if the page could not be fetched or the PDF
+    download failed transiently, so that the paper is retried on the next run.
+    """
+    full_link = f"https://digitalcommons.usu.edu{rel_link}" if rel_link.startswith('/') else rel_link
+    logging.info(f"Fetching paper page: {full_link}")
+    soup_temp, raw_html = fetch_page(full_link, parse_only=_PAPER_STRAINER)
+    if not soup_temp:
+        return None
+    article_title = get_article_title(soup_temp)
+    info = {
+        'Title': article_title,
+        'Date': paper_date,
+        'Abstract': extract_abstract(soup_temp),
+        'Link': rel_link
+    }
+    write_debug_html(os.path.join(output_dir, f"soup_debug_{_safe_filename(article_title)}.html"), raw_html)
+    pdf_url = find_pdf_link(soup_temp)
+    if not pdf_url:
+        logging.warning(f"PDF link not found for {article_title}")
+        return info
+    pdf_filename = f"{paper_date}_{_safe_filename(article_title)}.pdf"
+    pdf_path = os.path.join(output_dir, pdf_filename)
+    if download_flag:
+        if not os.path.exists(pdf_path):
+            try:
+                downloaded = download_pdf(pdf_url, pdf_path)
+            except PermanentDownloadError as e:
+                # Retrying on a later run would not help, so keep the metadata like a missing PDF link
+                logging.error(f"Giving up on PDF for {article_title}: {e}")
+                return info
+            if not downloaded:
+                logging.warning(f"Not checkpointing {rel_link} because its PDF download failed")
+                return None
+        else:
+            logging.info(f"PDF already exists, skipping download: {pdf_filename}")
+    return info
+
+
+def main(year=2025, test_flag=False, log_level=logging.INFO, download_flag=True, max_workers=MAX_CONNECTIONS_PER_HOST):
     """
     Downloads SmallSat papers and metadata for a given year.
     Args:
@@ -122,105 +455,96 @@ def main(year=2025, test_flag=False, log_level=logging.INFO, download_flag=True)
         test_flag (bool): If True, only download/process three papers.
         log_level: Python logging level.
         download_flag (bool): If True, download PDF files; if False, skip PDF download.
+        max_workers (int): Number of papers fetched/downloaded concurrently.
+            Requests beyond MAX_CONNECTIONS_PER_HOST wait for a pooled connection.
     """
     setup_logging(log_level)
     base_url = f"https://digitalcommons.usu.edu/smallsat/{year}/all{year}/"
-    logging.info(f"Fetching main page: {base_url}")
-    soup = fetch_soup(base_url)
-    if not soup:
-        return
     # Use a local output folder within the working directory
     output_dir = os.path.join(os.getcwd(), str(year))
     os.makedirs(output_dir, exist_ok=True)
-    if log_level == logging.DEBUG:
-        with open(os.path.join(output_dir, "soup_debug.html"), "w", encoding="utf-8") as f:
-            f.write(str(soup))
-    paper_date_map = extract_paper_links_with_dates(soup, year)
+    logging.info(f"Fetching main page: {base_url}")
+    # Only the schedule page is re-fetched on every run, so it is the only page worth revalidating;
+    # paper pages already in the CSV checkpoint are never requested again
+    raw_html = fetch_bytes(base_url, cache_dir=os.path.join(output_dir, HTTP_CACHE_DIRNAME))
+    if not raw_html:
+        return
+    write_debug_html(os.path.join(output_dir, "soup_debug.html"), raw_html)
+    paper_date_map = extract_paper_links_with_dates(raw_html, year)
     if not paper_date_map:
         logging.warning("No paper links found.")
         return
-    # Prepare to collect data for Excel
+    # Paper metadata is checkpointed to an append-only CSV; the Excel file is exported once at the end
     import pandas as pd
     excel_path = os.path.join(output_dir, f"papers_{year}.xlsx")
-    papers_info = []
+    csv_path = os.path.join(output_dir, f"papers_{year}.csv")
     processed_links = set()
-    # If Excel file exists, read it and collect processed links
-    if os.path.exists(excel_path):
+    if os.path.exists(csv_path):
+        try:
+            with open(csv_path, newline='', encoding='utf-8') as f_csv:
+                processed_links = {row['Link'] for row in csv.DictReader(f_csv) if row.get('Link')}
+            logging.info(f"Loaded {len(processed_links)} already processed papers from CSV.")
+        except Exception as e:
+            logging.error(f"Failed to read existing CSV file: {e}")
+    elif os.path.exists(excel_path):
+        # Seed the CSV checkpoint from an Excel file written by an earlier run
         try:
             df_existing = pd.read_excel(excel_path)
             if 'Link' in df_existing.columns:
+                df_existing.reindex(columns=PAPER_FIELDS).to_csv(csv_path, index=False, encoding='utf-8')
                 processed_links = set(df_existing['Link'].astype(str))
-                papers_info = df_existing.to_dict(orient='records')
             logging.info(f"Loaded {len(processed_links)} already processed papers from Excel.")
         except Exception as e:
             logging.error(f"Failed to read existing Excel file: {e}")
-    count = 0
-    paper_iter = paper_date_map.items()
-    if log_level == logging.WARNING:
-        paper_iter = tqdm(paper_iter, desc="Downloading papers", total=len(paper_date_map))
-    for rel_link, paper_date in paper_iter:
+    pending = []
+    for rel_link, paper_date in paper_date_map.items():
         if rel_link in processed_links:
             logging.info(f"Skipping already processed paper: {rel_link}")
             continue
-        full_link = f"https://digitalcommons.usu.edu{rel_link}" if rel_link.startswith('/') else rel_link
-        logging.info(f"Fetching paper page: {full_link}")
-        soup_temp = fetch_soup(full_link)
-        if not soup_temp:
-            continue
-        article_title = get_article_title(soup_temp)
-        # Extract abstract
-        abstract = ""
-        abstract_tag = soup_temp.find('div', id='abstract')
-        if abstract_tag:
-            abstract_p = abstract_tag.find('p')
-            from bs4.element import Tag
-            if isinstance(abstract_p, Tag):
-                abstract = abstract_p.get_text(strip=True)
-            elif isinstance(abstract_tag, Tag):
-                abstract = abstract_tag.get_text(strip=True)
-        else:
-            # Fallback: try meta tag
-            meta_abstract = soup_temp.find('meta', attrs={'name': 'description'})
-            from bs4.element import Tag
-            if isinstance(meta_abstract, Tag):
-                content = meta_abstract.get('content', None)
-                if content:
-                    abstract = content
-        papers_info.append({
-            'Title': article_title,
-            'Date': paper_date,
-            'Abstract': abstract,
-            'Link': rel_link
-        })
-        processed_links.add(rel_link)
-        if log_level == logging.DEBUG:
-            debug_html_path = os.path.join(output_dir, f"soup_debug_{article_title}.html")
-            with open(debug_html_path, "w", encoding="utf-8") as f_debug:
-                f_debug.write(str(soup_temp))
-        pdf_url = find_pdf_link(soup_temp)
-        if not pdf_url:
-            logging.warning(f"PDF link not found for {article_title}")
-            continue
-        pdf_filename = f"{paper_date}_{article_title}.pdf"
-        pdf_path = os.path.join(output_dir, pdf_filename)
-        if download_flag:
-            if not os.path.exists(pdf_path):
-                download_pdf(pdf_url, pdf_path)
-            else:
-                logging.info(f"PDF already exists, skipping download: {pdf_filename}")
-        count += 1
-        # Write Excel after each paper
+        pending.append((rel_link, paper_date))
+    if test_flag:
+        # Only submit three papers so the test run stays small
+        pending = pending[:3]
+    write_header = not os.path.exists(csv_path) or os.path.getsize(csv_path) == 0
+    with open(csv_path, 'a', newline='', encoding='utf-8') as f_csv, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        writer = csv.DictWriter(f_csv, fieldnames=PAPER_FIELDS)
+        if write_header:
+            writer.writeheader()
+        futures = [
+            executor.submit(process_paper, rel_link, paper_date, output_dir, download_flag)
+            for rel_link, paper_date in pending
+        ]
+        done_iter = as_completed(futures)
+        if log_level == logging.WARNING:
+            done_iter = tqdm(done_iter, desc="Downloading papers", total=len(futures))
         try:
-            df = pd.DataFrame(papers_info)
-            df.to_excel(excel_path, index=False)
-            logging.info(f"Updated paper info to Excel: {excel_path}")
-        except Exception as e:
-            logging.error(f"Failed to update Excel file: {e}")
-        if test_flag and count >= 3:
-            logging.info("Test flag set: downloaded three papers, exiting early.")
-            break
-
-    # Excel writing now happens after each paper download
+            # Results are only consumed here on the main thread, so the checkpoint needs no lock
+            for future in done_iter:
+                try:
+                    info = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to process paper: {e}")
+                    continue
+                if not info:
+                    continue
+                processed_links.add(info['Link'])
+                # Append each paper to the CSV checkpoint as soon as it is processed
+                writer.writerow(info)
+                f_csv.flush()
+        except KeyboardInterrupt:
+            # Drop queued papers so Ctrl-C only waits for the downloads already in flight
+            logging.warning("Interrupted, cancelling pending papers.")
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+    # Export the accumulated metadata to Excel in a single pass
+    try:
+        pd.read_csv(csv_path, dtype=str, keep_default_na=False, encoding='utf-8').to_excel(excel_path, index=False)
+        logging.info(f"Wrote paper info to Excel: {excel_path}")
+    except Exception as e:
+        logging.error(f"Failed to write Excel file: {e}")
+    if test_flag:
+        logging.info("Test flag set: processed three papers, exiting.")
 
 if __name__ == "__main__":
     # Set test_flag to True to only download three papers and exit